@@ -2,27 +2,52 @@ import numpy as np
 import matplotlib.pyplot as plt
 import os
 
+from joblib import Parallel, delayed
+
 from src.transmitter import (
     generate_random_bits,
     generate_ofdm_stream
 )
 from src.receiver import (
-    remove_cyclic_prefix, fft_ofdm,
-    demodulate_ofdm_symbols, compute_ber
+    rx_freq, qpsk_demodulate, qam16_demodulate,
+    compute_ber
 )
 from src.channel import awgn_channel
 
+# The compiled Monte Carlo kernel needs numba + rocket-fft; fall back
+# to the joblib process pool when they are not installed.
+try:
+    from src.monte_carlo import run_trials as _run_trials_compiled
+    from src.transmitter import _QPSK_LUT, _QAM16_LUT
+except ImportError:
+    _run_trials_compiled = None
+
 # ----------------------------------
 # Simulation parameters
 # ----------------------------------
 FFT_SIZE = 64
 CP_LEN = 16
-NUM_SYMBOLS = 5000 
-MONTE_CARLO_TRIALS = 50  
+NUM_SYMBOLS = 5000
+MONTE_CARLO_TRIALS = 50
+
+# OFDM symbols per constellation snapshot; enough points for a dense
+# scatter without dragging a full NUM_SYMBOLS array into the plots.
+SNAPSHOT_SYMBOLS = 100
+
+# SNR points at which constellation snapshots are captured during the
+# BER sweep, so the plots do not re-run the TX/RX chain afterwards.
+SNAPSHOT_SNRS = (0, 10, 20)
 
 # SNR range for BER curves
 SNR_RANGE = np.arange(0, 21, 2)  # 0–20 dB
 
+# Average power of the transmitted OFDM stream. The constellations are
+# normalized to unit average power, the IFFT scales by 1/FFT_SIZE (so
+# time-domain power is 1/FFT_SIZE), and the cyclic prefix copies
+# existing samples without changing the average. Passing this to
+# awgn_channel avoids re-measuring the signal power every trial.
+SIG_POWER = 1.0 / FFT_SIZE
+
 # Ensure results directories exist
 os.makedirs("results", exist_ok=True)
 os.makedirs("results/images", exist_ok=True)
@@ -30,24 +55,88 @@ os.makedirs("results/images", exist_ok=True)
 # ----------------------------------
 # BER Simulation (with Monte Carlo)
 # ----------------------------------
-def simulate_ber_monte_carlo(modulation: str) -> np.ndarray:
-    ber_out_avg = []
+def _run_trial_chunk(snr_db: float, modulation: str, seeds) -> list:
+    """
+    Run one TX -> AWGN -> RX pass per seed and return the BER of each.
+
+    The TX stream and noise scratch buffers are allocated once and
+    reused across all trials in the chunk, so per-trial allocation is
+    limited to the small intermediate arrays.
+    """
     bits_per_sub = 2 if modulation == "QPSK" else 4
+    total_bits = NUM_SYMBOLS * FFT_SIZE * bits_per_sub
+
+    # Resolve the modulation branch once for the whole chunk instead of
+    # re-dispatching on the string inside every trial.
+    demodulate = qpsk_demodulate if modulation == "QPSK" else qam16_demodulate
+
+    tx_buf = np.empty((NUM_SYMBOLS, FFT_SIZE + CP_LEN), dtype=np.complex64)
+    noise_buf = np.empty(tx_buf.shape + (2,), dtype=np.float32)
+
+    ber_trials = []
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        bits_tx = generate_random_bits(total_bits, rng)
+        ofdm_stream = generate_ofdm_stream(bits_tx, FFT_SIZE, CP_LEN,
+                                           modulation, out=tx_buf)
+        noisy_stream = awgn_channel(ofdm_stream, snr_db, rng, noise_buf,
+                                    sig_power=SIG_POWER)
+        freq_symbols = rx_freq(noisy_stream, CP_LEN)
+        bits_rx = demodulate(freq_symbols)
+        ber_trials.append(compute_ber(bits_tx, bits_rx))
+
+    return ber_trials
+
+
+def _constellation_snapshot(snr_db: float, modulation: str) -> np.ndarray:
+    """
+    Run one small TX -> AWGN -> RX pass and return the RX frequency
+    symbols, for constellation plotting.
+    """
+    rng = np.random.default_rng(0)
+    bits_per_sub = 2 if modulation == "QPSK" else 4
+    bits_tx = generate_random_bits(SNAPSHOT_SYMBOLS * FFT_SIZE * bits_per_sub, rng)
+    ofdm_stream = generate_ofdm_stream(bits_tx, FFT_SIZE, CP_LEN, modulation)
+    noisy_stream = awgn_channel(ofdm_stream, snr_db, rng, sig_power=SIG_POWER)
+    return rx_freq(noisy_stream, CP_LEN)
 
-    for snr in SNR_RANGE:
-        ber_trials = []
-        for _ in range(MONTE_CARLO_TRIALS):
-            total_bits = NUM_SYMBOLS * FFT_SIZE * bits_per_sub
-            bits_tx = generate_random_bits(total_bits)
 
-            ofdm_stream = generate_ofdm_stream(bits_tx, FFT_SIZE, CP_LEN, modulation)
-            noisy_stream = awgn_channel(ofdm_stream, snr)
-            ofdm_no_cp = remove_cyclic_prefix(noisy_stream, CP_LEN)
-            freq_symbols = fft_ofdm(ofdm_no_cp)
-            bits_rx = demodulate_ofdm_symbols(freq_symbols, modulation)
+def simulate_ber_monte_carlo(modulation: str, snapshots: dict = None) -> np.ndarray:
+    """
+    Average BER over the Monte Carlo trials at every SNR point.
 
-            ber_value = compute_ber(bits_tx, bits_rx)
-            ber_trials.append(ber_value)
+    When a snapshots dict is given, the RX frequency symbols at each
+    SNR in SNAPSHOT_SNRS are captured into it (keyed by SNR) with one
+    cheap extra pass, so the constellation plots can reuse them instead
+    of re-running the whole chain later.
+    """
+    ber_out_avg = []
+    bits_per_sub = 2 if modulation == "QPSK" else 4
+
+    for snr in SNR_RANGE:
+        if snapshots is not None and snr in SNAPSHOT_SNRS:
+            snapshots[snr] = _constellation_snapshot(snr, modulation)
+        if _run_trials_compiled is not None:
+            # Whole trial chain compiled into one kernel; trials run on
+            # parallel threads inside it.
+            lut = _QPSK_LUT if modulation == "QPSK" else _QAM16_LUT
+            ber_trials = _run_trials_compiled(
+                MONTE_CARLO_TRIALS, float(snr), FFT_SIZE, CP_LEN,
+                NUM_SYMBOLS, bits_per_sub, lut, 0,
+            )
+        else:
+            # Trials are fully independent, so fan them out over a
+            # process pool in one chunk per worker; each trial gets its
+            # own seed for a distinct random stream, and each worker
+            # reuses its scratch buffers across its chunk.
+            seed_chunks = np.array_split(
+                np.arange(MONTE_CARLO_TRIALS), os.cpu_count() or 1
+            )
+            chunk_results = Parallel(n_jobs=-1, backend="loky")(
+                delayed(_run_trial_chunk)(snr, modulation, chunk)
+                for chunk in seed_chunks if chunk.size
+            )
+            ber_trials = [ber for chunk in chunk_results for ber in chunk]
 
         avg_ber = np.mean(ber_trials)
         print(f"{modulation} @ {snr} dB → avg BER = {avg_ber:.6e}")
@@ -58,20 +147,11 @@ def simulate_ber_monte_carlo(modulation: str) -> np.ndarray:
 # ----------------------------------
 # Constellation Plot Function
 # ----------------------------------
-def plot_constellations(modulation: str, snr_list=(0, 10, 20)):
-    plt.figure(figsize=(len(snr_list) * 4, 4))
-    
-    bits_per_sub = 2 if modulation == "QPSK" else 4
-    total_bits = FFT_SIZE * bits_per_sub
-
-    for idx, snr in enumerate(snr_list):
-        bits_tx = generate_random_bits(total_bits)
-        ofdm_symbol = generate_ofdm_stream(bits_tx, FFT_SIZE, CP_LEN, modulation)
-        noisy = awgn_channel(ofdm_symbol, snr)
-        base_no_cp = remove_cyclic_prefix(noisy, CP_LEN)
-        freq_syms = fft_ofdm(base_no_cp)
+def plot_constellations(modulation: str, snapshots: dict):
+    plt.figure(figsize=(len(snapshots) * 4, 4))
 
-        plt.subplot(1, len(snr_list), idx + 1)
+    for idx, (snr, freq_syms) in enumerate(sorted(snapshots.items())):
+        plt.subplot(1, len(snapshots), idx + 1)
         plt.scatter(freq_syms.real.flatten(),
                     freq_syms.imag.flatten(),
                     s=2, alpha=0.5)
@@ -80,9 +160,9 @@ def plot_constellations(modulation: str, snr_list=(0, 10, 20)):
         plt.ylabel("Imag")
         plt.grid(True)
 
-    plt.suptitle(f"{modulation} Constellation\n{NUM_SYMBOLS} OFDM symbols, FFT={FFT_SIZE}, CP={CP_LEN}")
+    plt.suptitle(f"{modulation} Constellation\n{SNAPSHOT_SYMBOLS} OFDM symbols, FFT={FFT_SIZE}, CP={CP_LEN}")
     plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig(f"results/images/constellation_{modulation}_{NUM_SYMBOLS}symbols.png", dpi=300)
+    plt.savefig(f"results/images/constellation_{modulation}_{SNAPSHOT_SYMBOLS}symbols.png", dpi=300)
     plt.show()
     plt.close()
 
@@ -90,9 +170,11 @@ def plot_constellations(modulation: str, snr_list=(0, 10, 20)):
 # Main Execution
 # ----------------------------------
 def main():
-    # Run BER for both modulations with Monte Carlo
-    ber_qpsk = simulate_ber_monte_carlo("QPSK")
-    ber_16qam = simulate_ber_monte_carlo("16QAM")
+    # Run BER for both modulations with Monte Carlo, capturing the
+    # constellation snapshots for the plots along the way.
+    snaps_qpsk, snaps_16qam = {}, {}
+    ber_qpsk = simulate_ber_monte_carlo("QPSK", snapshots=snaps_qpsk)
+    ber_16qam = simulate_ber_monte_carlo("16QAM", snapshots=snaps_16qam)
 
     # ---------------------------
     # Plot BER vs SNR
@@ -112,8 +194,8 @@ def main():
     # ---------------------------
     # Constellations at selected SNRs
     # ---------------------------
-    plot_constellations("QPSK", snr_list=(0, 10, 20))
-    plot_constellations("16QAM", snr_list=(0, 10, 20))
+    plot_constellations("QPSK", snaps_qpsk)
+    plot_constellations("16QAM", snaps_16qam)
 
     # ---------------------------
     # Save BER results to CSV with SNR as integer
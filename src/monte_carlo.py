@@ -0,0 +1,153 @@
+"""
+monte_carlo.py
+
+Numba-compiled Monte Carlo kernel for BER simulation.
+
+The per-trial chain (bit generation, LUT modulation, IFFT, cyclic
+prefix, AWGN, FFT, minimum-distance demodulation, error counting) is
+compiled into a single @njit function so no intermediate result crosses
+the Python boundary, and the independent trials run in parallel threads
+via prange. The FFT calls inside the kernel are provided by rocket-fft,
+which registers pocketfft-backed implementations of np.fft with Numba.
+
+The kernel is modulation-agnostic: it takes the same symbol lookup
+tables the transmitter uses (transmitter._QPSK_LUT / _QAM16_LUT), where
+the table index is the packed bit group, so modulation is a gather and
+demodulation is an argmin over the table followed by unpacking the
+winning index.
+
+cache=True persists the compiled machine code next to this module, so
+only the first run after a source change pays the ~1 s compile cost;
+later runs (and CI sweeps) load it from disk. Run
+
+    python -m src.monte_carlo
+
+to warm the cache ahead of time. (numba.pycc ahead-of-time compilation
+was removed from recent Numba releases, so the disk cache is the
+supported way to skip warmup.)
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Imported for its side effect of registering np.fft support with
+# Numba. The explicit import also makes a missing rocket-fft raise
+# ImportError here, at import time, instead of a TypingError when the
+# kernel first compiles — which is what lets the simulation driver fall
+# back to its process-pool path.
+import rocket_fft  # noqa: F401
+
+
+@njit(parallel=True, cache=True)
+def run_trials(
+    num_trials: int,
+    snr_db: float,
+    fft_size: int,
+    cp_len: int,
+    num_symbols: int,
+    bits_per_sub: int,
+    lut: np.ndarray,
+    base_seed: int,
+) -> np.ndarray:
+    """
+    Run num_trials independent TX -> AWGN -> RX passes and return the
+    BER of each trial as a float64 array.
+
+    Args:
+        num_trials (int): Number of Monte Carlo trials.
+        snr_db (float): SNR in dB for the AWGN channel.
+        fft_size (int): FFT size (number of subcarriers).
+        cp_len (int): Cyclic prefix length.
+        num_symbols (int): OFDM symbols per trial.
+        bits_per_sub (int): Bits per subcarrier (2 for QPSK, 4 for 16-QAM).
+        lut (np.ndarray): Symbol table indexed by the packed bit group.
+        base_seed (int): Seed offset; trial t uses base_seed + t.
+
+    Returns:
+        np.ndarray: Per-trial BER values of shape (num_trials,).
+    """
+    bits_per_symbol = fft_size * bits_per_sub
+    total_bits = num_symbols * bits_per_symbol
+    n_points = lut.shape[0]
+
+    # Unit-power constellations through a 1/N-scaled IFFT give a
+    # time-domain signal power of 1/fft_size (see awgn_channel).
+    snr_linear = 10.0 ** (snr_db / 10.0)
+    noise_power = (1.0 / fft_size) / snr_linear
+    noise_scale = np.sqrt(noise_power / 2.0)
+
+    bers = np.empty(num_trials, dtype=np.float64)
+
+    for t in prange(num_trials):
+        # Seed the per-thread generator so trials are reproducible and
+        # never share a random stream.
+        np.random.seed(base_seed + t)
+        bits = np.random.randint(0, 2, total_bits)
+
+        # LUT modulation straight into the frequency-domain frame.
+        frames = np.empty((num_symbols, fft_size), dtype=np.complex128)
+        for s in range(num_symbols):
+            for c in range(fft_size):
+                base = s * bits_per_symbol + c * bits_per_sub
+                idx = 0
+                for k in range(bits_per_sub):
+                    idx = (idx << 1) | bits[base + k]
+                frames[s, c] = lut[idx]
+
+        time_signal = np.fft.ifft(frames)
+
+        # Cyclic prefix plus complex AWGN.
+        rx = np.empty((num_symbols, fft_size + cp_len), dtype=np.complex128)
+        rx[:, :cp_len] = time_signal[:, fft_size - cp_len:]
+        rx[:, cp_len:] = time_signal
+        for s in range(num_symbols):
+            for c in range(fft_size + cp_len):
+                rx[s, c] += complex(
+                    np.random.normal(0.0, noise_scale),
+                    np.random.normal(0.0, noise_scale),
+                )
+
+        freq = np.fft.fft(np.ascontiguousarray(rx[:, cp_len:]))
+
+        # Minimum-distance demodulation over the symbol table; the
+        # winning index unpacks directly to the received bit group.
+        errors = 0
+        for s in range(num_symbols):
+            for c in range(fft_size):
+                re = freq[s, c].real
+                im = freq[s, c].imag
+                best = 0
+                best_d = np.inf
+                for p in range(n_points):
+                    dr = re - lut[p].real
+                    di = im - lut[p].imag
+                    d = dr * dr + di * di
+                    if d < best_d:
+                        best_d = d
+                        best = p
+                base = s * bits_per_symbol + c * bits_per_sub
+                for k in range(bits_per_sub):
+                    rx_bit = (best >> (bits_per_sub - 1 - k)) & 1
+                    if rx_bit != bits[base + k]:
+                        errors += 1
+
+        bers[t] = errors / total_bits
+
+    return bers
+
+
+def precompile() -> None:
+    """
+    Compile run_trials and populate the on-disk cache.
+
+    Runs one tiny trial so the kernel is compiled for the complex64
+    lookup-table signature the simulations use; subsequent processes
+    load the cached machine code instead of JIT-compiling.
+    """
+    lut = np.array([1 + 1j, -1 + 1j, 1 - 1j, -1 - 1j], dtype=np.complex64)
+    lut /= np.float32(np.sqrt(2))
+    run_trials(1, 10.0, 8, 2, 1, 2, lut, 0)
+
+
+if __name__ == "__main__":
+    precompile()